@@ -3,25 +3,102 @@
     - firebase-admin
     - google-auth
     - oauth2client
+    - cachecontrol
 """
 
 import contextlib
 import datetime
+import functools
+import hashlib
 import json
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from pathlib import Path
 import time
 from typing import Any, Callable, Optional, TypedDict
 
+# noinspection PyUnresolvedReferences
+import cachecontrol
 import firebase_admin.auth  # Installed by auth dependencies
 import google.auth.crypt
 import google.auth.transport.requests
 import google.oauth2.service_account
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from oauth2client.client import OAuth2Credentials, credentials_from_code
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional - 2-3x faster than stdlib json, parses directly from bytes
+    # noinspection PyUnresolvedReferences
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Shared pooled session for all Firebase / Google HTTP calls - reuses TCP+TLS connections across calls
+# Retries transient failures (429/5xx, honoring Retry-After) with exponential backoff;
+# 401/403 are credential problems and are not retried
+_retry_transient = Retry(
+    total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(['GET', 'POST']), respect_retry_after_header=True,
+)
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=_retry_transient))
+_cached_session = cachecontrol.CacheControl(_session)
+
+_firebase_app: Optional['firebase_admin.App'] = None
+_firebase_app_lock = threading.Lock()
+
+
+def get_firebase_app() -> 'firebase_admin.App':
+    """
+        Lazily initialize (or adopt the existing) shared firebase_admin App;
+        Passing it explicitly to verify/create calls skips the default-app registry lookup on the hot
+        path, and the App's key cache is shared by all callers
+    """
+    global _firebase_app
+    with _firebase_app_lock:
+        if _firebase_app is None:
+            try:
+                _firebase_app = firebase_admin.get_app()
+            except ValueError:
+                _firebase_app = firebase_admin.initialize_app()
+
+        return _firebase_app
+
+
+_httpx_client: Optional[httpx.Client] = None
+_httpx_client_lock = threading.Lock()
+
+
+def get_shared_httpx_client() -> httpx.Client:
+    """
+        Shared httpx client for bulk token refresh / sign-in (pass as `client` to `google_sign_in_with_*`);
+        Uses HTTP/2 when the `h2` package is installed, multiplexing many concurrent refreshes
+        over a single connection instead of one TLS handshake per call
+    """
+    global _httpx_client
+    with _httpx_client_lock:
+        if _httpx_client is None:
+            try:
+                # noinspection PyUnresolvedReferences
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            _httpx_client = httpx.Client(
+                http2=http2, limits=httpx.Limits(max_keepalive_connections=20), timeout=10.0
+            )
+
+        return _httpx_client
+
 
 class DecodedIdTokenDict(TypedDict):
     iss: str
@@ -37,16 +114,94 @@ class DecodedIdTokenDict(TypedDict):
     claims: dict[str, Any]
 
 
-def firebase_verify_id_token(id_token: str, n_retries=3) -> DecodedIdTokenDict | None:
+# Error-message prefixes that mark a verification failure as transient (worth retrying)
+# `str.startswith` accepts a tuple and tests all prefixes in a single C-level call
+_RETRY_PREFIXES = ('Token used too early,', "('Connection aborted.', ")
+
+# Cache of decoded id-tokens, keyed by sha256 of the raw token
+# Off by default - while an entry is cached, a revoked token is still accepted until the entry expires
+_VERIFY_CACHE_TTL_SEC = 5.0
+_VERIFY_CACHE_MAX_SIZE = 10000
+
+_verify_cache: OrderedDict[bytes, tuple[float, DecodedIdTokenDict]] = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+# Single-flight map of in-progress verifications - concurrent calls with the same token await one Future
+_verify_inflight: dict[bytes, Future] = {}
+_verify_inflight_lock = threading.Lock()
+
+
+def firebase_verify_id_token(id_token: str, n_retries=3, *, use_cache=False) -> DecodedIdTokenDict | None:
+    """
+        Verify a Firebase id-token and return the decoded claims (None if verification failed)
+
+        :param use_cache: Skip the signature verification for recently verified tokens (short TTL LRU cache);
+            Trade-off: a revoked token is accepted until its cache entry expires
+    """
+    key = hashlib.sha256(id_token.encode()).digest()
+
+    if not use_cache:
+        return _firebase_verify_id_token_single_flight(key, id_token, n_retries)
+
+    now = time.time()
+
+    with _verify_cache_lock:
+        cached = _verify_cache.get(key)
+        if cached is not None:
+            expires_at, decoded_token = cached
+            if expires_at > now:
+                _verify_cache.move_to_end(key)
+                return decoded_token
+
+            del _verify_cache[key]
+
+    decoded_token = _firebase_verify_id_token_single_flight(key, id_token, n_retries)
+
+    if decoded_token is not None:
+        expires_at = min(float(decoded_token['exp']), now + _VERIFY_CACHE_TTL_SEC)
+        with _verify_cache_lock:
+            _verify_cache[key] = (expires_at, decoded_token)
+            while len(_verify_cache) > _VERIFY_CACHE_MAX_SIZE:
+                _verify_cache.popitem(last=False)
+
+    return decoded_token
+
+
+def _firebase_verify_id_token_single_flight(key: bytes, id_token: str, n_retries: int) -> DecodedIdTokenDict | None:
+    with _verify_inflight_lock:
+        future = _verify_inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _verify_inflight[key] = future
+
+    if not is_owner:
+        # Another thread is already verifying this exact token - await its result
+        return future.result()
+
+    try:
+        decoded_token = _firebase_verify_id_token_uncached(id_token, n_retries)
+        future.set_result(decoded_token)
+
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+
+    finally:
+        with _verify_inflight_lock:
+            _verify_inflight.pop(key, None)
+
+    return decoded_token
+
+
+def _firebase_verify_id_token_uncached(id_token: str, n_retries=3) -> DecodedIdTokenDict | None:
     with contextlib.suppress(Exception):
         while n_retries > 0:
             try:
-                return firebase_admin.auth.verify_id_token(id_token)
+                return firebase_admin.auth.verify_id_token(id_token, app=get_firebase_app())
 
             except Exception as e:
-                retry_strings = ['Token used too early,', "('Connection aborted.', "]
-                should_retry = any(str(e).startswith(retry_str) for retry_str in retry_strings)
-                if not should_retry:
+                if not str(e).startswith(_RETRY_PREFIXES):
                     logger.exception('Error while verifying id-token')
                     break
 
@@ -74,7 +229,7 @@ class SignInWithRefreshTokenResponseDict(TypedDict):
 
 
 def google_sign_in_with_custom_token(
-    uid: str, *, api_key: str, referer: str = None, additional_claims=None
+    uid: str, *, api_key: str, referer: str = None, additional_claims=None, client: httpx.Client = None
 ) -> SignInWithCustomTokenResponseDict:
     """
         Create an id-token for a user with the given uid, by exchanging a custom token with the firebase auth service
@@ -82,26 +237,27 @@ def google_sign_in_with_custom_token(
         Notes:
             - API Key must have the following APIs enabled: `Identity Toolkit API`
             - API HTTP Referer might be required to be set in the API Key settings
+            - For bulk sign-ins, pass `client=get_shared_httpx_client()` to multiplex calls over HTTP/2
     """
 
     url_sign_in_with_custom_token = 'https://identitytoolkit.googleapis.com/v1/accounts:signInWithCustomToken'
-    custom_token = firebase_admin.auth.create_custom_token(uid, additional_claims).decode()
+    custom_token = firebase_admin.auth.create_custom_token(uid, additional_claims, app=get_firebase_app()).decode()
 
     headers = {}
     if referer:
         headers['Referer'] = referer
 
-    res = requests.post(
+    res = (client or _cached_session).post(
         f'{url_sign_in_with_custom_token}?key={api_key}',
         json={'token': custom_token, 'returnSecureToken': True},
         headers=headers,
     )
     res.raise_for_status()
-    return res.json()
+    return _json_loads(res.content)
 
 
 def google_sign_in_with_refresh_token(
-    refresh_token: str, *, api_key: str, referer: str = None
+    refresh_token: str, *, api_key: str, referer: str = None, client: httpx.Client = None
 ) -> SignInWithRefreshTokenResponseDict:
     """
         Similar to `google_sign_in_with_custom_token`, but uses a refresh token instead of a custom token
@@ -112,28 +268,35 @@ def google_sign_in_with_refresh_token(
     if referer:
         headers['Referer'] = referer
 
-    res = requests.post(
+    res = (client or _cached_session).post(
         f'{url_sign_in_with_refresh_token}?key={api_key}',
         json={'grant_type': 'refresh_token', 'refresh_token': refresh_token},
         headers=headers,
     )
     res.raise_for_status()
-    return res.json()
+    return _json_loads(res.content)
 
 
-@staticmethod
 def load_credentials_service_account(scopes: list[str] = None, path_secret_json=None) -> google.oauth2.service_account.Credentials:
-    scopes = scopes or ['https://www.googleapis.com/auth/drive']
-    return google.oauth2.service_account.Credentials.from_service_account_file(str(path_secret_json), scopes=scopes)
+    scopes = tuple(scopes) if scopes else ('https://www.googleapis.com/auth/drive',)
+    return _load_credentials_service_account_cached(str(path_secret_json), scopes)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_credentials_service_account_cached(
+    path_secret_json: str, scopes: tuple[str, ...]
+) -> google.oauth2.service_account.Credentials:
+    # `from_service_account_file` re-parses the JSON and re-imports the RSA signing key on every
+    # call; the Credentials object is safe to share, so cache it per (path, scopes)
+    return google.oauth2.service_account.Credentials.from_service_account_file(path_secret_json, scopes=list(scopes))
 
 
-@staticmethod
 def load_credentials_user_code(code, client_id=None, client_secret=None, scopes=None, path_secret_web_client_json=None) -> OAuth2Credentials:
     scopes = scopes or ['https://www.googleapis.com/auth/drive.file']
 
     if path_secret_web_client_json:
         path_secret = Path(path_secret_web_client_json)
-        web_client_info = json.loads(path_secret.read_text())
+        web_client_info = _json_loads(path_secret.read_bytes())
         client_id = client_id or web_client_info['web']['client_id']
         client_secret = client_secret or web_client_info['web']['client_secret']
 
@@ -142,7 +305,6 @@ def load_credentials_user_code(code, client_id=None, client_secret=None, scopes=
     )
 
 
-@staticmethod
 def load_credentials_user_info_obj(info: dict):
     return google.oauth2.credentials.Credentials.from_authorized_user_info(info)
 
@@ -156,8 +318,6 @@ class TokenProviderBase:
         raise NotImplementedError()
 
     def on_new_expiry(self, expires_in: float):
-        self.dt_expires = datetime.datetime.now() + datetime.timedelta(seconds=expires_in)
-
         if expires_in < self.margin_sec:
             self.margin_sec = expires_in / 2
             logger.warning(
@@ -170,7 +330,7 @@ class TokenProviderBase:
     def should_refresh(self):
         return (
             self.dt_expires is None or
-            self.dt_expires < datetime.datetime.now() + datetime.timedelta(self.margin_sec)
+            self.dt_expires < datetime.datetime.now() + datetime.timedelta(seconds=self.margin_sec)
         )
 
 
@@ -196,8 +356,13 @@ class TokenProvider(TokenProviderBase):
 
 
 class TokenProviderRefresh(TokenProviderBase):
+    # Backoff range for the background refresh thread after a failed refresh
+    REFRESH_BACKOFF_MIN_SEC = 5.0
+    REFRESH_BACKOFF_MAX_SEC = 60.0 * 5
+
     def __init__(
-        self, *, refresh_token: str, api_key: str, referer: str = None, margin_sec: float = None
+        self, *, refresh_token: str, api_key: str, referer: str = None, margin_sec: float = None,
+        auto_refresh: bool = False
     ):
         super().__init__(margin_sec=margin_sec)
 
@@ -206,14 +371,46 @@ class TokenProviderRefresh(TokenProviderBase):
         self.api_key = api_key
         self.referer = referer
 
+        self._lock = threading.RLock()
+
+        if auto_refresh:
+            threading.Thread(daemon=True, target=self._refresh_loop).start()
+
     def use_refresh_token(self):
-        self.refresh_token_response = google_sign_in_with_refresh_token(
-            self.refresh_token, api_key=self.api_key, referer=self.referer
-        )
-        self.on_new_expiry(float(self.refresh_token_response['expires_in']))
+        with self._lock:
+            self.refresh_token_response = google_sign_in_with_refresh_token(
+                self.refresh_token, api_key=self.api_key, referer=self.referer
+            )
+            self.on_new_expiry(float(self.refresh_token_response['expires_in']))
 
     def get_token(self):
-        if self.should_refresh():
-            self.use_refresh_token()
+        with self._lock:
+            if self.should_refresh():
+                self.use_refresh_token()
+
+            return self.refresh_token_response['id_token']
+
+    def _refresh_loop(self):
+        """
+            Refresh the token in the background before `margin_sec` is crossed,
+            so `get_token()` never pays the refresh round-trip on the caller's path
+        """
+        backoff_sec = self.REFRESH_BACKOFF_MIN_SEC
+
+        while True:
+            try:
+                with self._lock:
+                    if self.should_refresh():
+                        self.use_refresh_token()
+
+                    sleep_for = (
+                        self.dt_expires - datetime.datetime.now() - datetime.timedelta(seconds=self.margin_sec)
+                    ).total_seconds()
+
+                backoff_sec = self.REFRESH_BACKOFF_MIN_SEC
+                time.sleep(max(sleep_for, 1.0))
 
-        return self.refresh_token_response['id_token']
+            except Exception:
+                logger.exception('Background token refresh failed; Retrying')
+                time.sleep(backoff_sec)
+                backoff_sec = min(backoff_sec * 2, self.REFRESH_BACKOFF_MAX_SEC)
@@ -1,3 +1,4 @@
+import functools
 import importlib.util
 import json
 import logging
@@ -11,6 +12,14 @@ import dacite
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional - 2-3x faster than stdlib json, parses directly from bytes
+    # noinspection PyUnresolvedReferences
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 T = TypeVar('T')
 
 
@@ -33,14 +42,30 @@ def search_file_in_paths(filename: Union[Path, str], paths: Optional[list[Path]]
         - If filename is relative, search for it in the given paths
         - If filename is not found, return None
         - Use system PATH if paths is None
+
+        Results are cached - repeated lookups skip the per-path stat calls
+        (call `_search_file_in_paths_cached.cache_clear()` if PATH / cwd / files changed)
     """
 
     filename = Path(filename)
     if filename.is_absolute():
         return filename
 
+    paths_tuple = tuple(str(p) for p in paths) if paths is not None else None
+    try:
+        return _search_file_in_paths_cached(str(filename), paths_tuple, include_cwd)
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _search_file_in_paths_cached(filename: str, paths: Optional[tuple[str, ...]], include_cwd: bool):
+    # Misses raise instead of returning None - lru_cache doesn't cache exceptions, so
+    # only hits are memoized and a file created after a failed lookup is still found
     if paths is None:
         paths = os.environ["PATH"].split(os.pathsep)
+    else:
+        paths = list(paths)
 
     if include_cwd:
         paths = [os.getcwd()] + paths
@@ -50,20 +75,27 @@ def search_file_in_paths(filename: Union[Path, str], paths: Optional[list[Path]]
         if full_path.exists():
             return full_path
 
-    return None
+    raise FileNotFoundError(filename)
 
 
 def import_module(path: Union[Path, str]):
     """
         Import a module from a given path
         Module will be imported using the current PYTHONPATH even if it isn't on it
+
+        Repeated calls return the cached module unless the file changed on disk (mtime based)
     """
 
-    path = Path(path)
+    path = Path(path).resolve()
+    return _import_module_cached(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _import_module_cached(path_str: str, _mtime_ns: int):
+    path = Path(path_str)
     spec = importlib.util.spec_from_file_location(path.stem, path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
-
     return module
 
 
@@ -104,7 +136,7 @@ def load_config(config_class: Type[T], path_config: Union[Path, str]) -> T:
 
     match suffix.lower():
         case '.json':
-            obj = json.loads(path_config.read_text())
+            obj = _json_loads(path_config.read_bytes())
 
         case '.yaml' | '.yml':
             obj = _load_yaml(path_config)
@@ -135,13 +167,16 @@ def _load_hocon(path_config):
 
 
 def _load_yaml(path_config):
-    # # noinspection PyUnresolvedReferences
-    # import yaml
     try:
         # noinspection PyUnresolvedReferences
         import yaml
     except ImportError as e:
         raise ImportError('pyyaml is required to load YAML files') from e
 
-    obj = yaml.safe_load(path_config.read_text())
+    # Prefer libyaml's C loader when available (5-10x faster than the pure-Python loader);
+    # Pass the file object so the parser streams it instead of a separate full read
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with path_config.open('rb') as f:
+        obj = yaml.load(f, Loader=loader)
+
     return obj
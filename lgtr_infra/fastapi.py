@@ -4,11 +4,10 @@
     - Other packages mentioned in `auth` module
 """
 
+import asyncio
 import logging
 from typing import Optional
 
-# noinspection PyUnresolvedReferences
-import cachecontrol
 import google.auth.crypt
 import google.auth.transport.requests
 import google.oauth2.service_account
@@ -20,22 +19,22 @@ from lgtr_infra.auth import firebase_verify_id_token
 
 logger = logging.getLogger(__name__)
 
-_session = google.auth.transport.requests.requests.session()
-_cached_session = cachecontrol.CacheControl(_session)
-
 http_scheme = HTTPBearer(auto_error=False)
 
 
-def firebase_verify_id_token_http_creds(
+async def firebase_verify_id_token_http_creds(
     creds: Optional[HTTPAuthorizationCredentials] = Depends(http_scheme)
 ):
     """
         Returns None if no credentials were provided in the request, or if the credentials could not be validated
+
+        The CPU-bound verify (and possible JWKS fetch) runs via `asyncio.to_thread`,
+        so the event loop keeps serving other requests while tokens are verified
     """
     if not creds:
         return None
 
-    return firebase_verify_id_token(creds.credentials)
+    return await asyncio.to_thread(firebase_verify_id_token, creds.credentials)
 
 
 def require_firebase_verify_id_token_http_creds(
@@ -1,23 +1,47 @@
 import contextlib
+import functools
 import logging
+import threading
 from collections.abc import Mapping
 from dataclasses import asdict
+from io import BytesIO
 from typing import Any, Tuple
 
 import google.auth
+from google.auth.transport.requests import AuthorizedSession
 import gspread
 import numpy as np
 import pandas as pd
-from gspread.utils import rowcol_to_a1
+from gspread.utils import absolute_range_name, rowcol_to_a1
 
 from lgtr_infra.sheets import df_match_columns, normalize_column_name
 
 logger = logging.getLogger(__name__)
 
 
-def create_default_client():
-    creds, _ = google.auth.default(
-        scopes=['https://www.googleapis.com/auth/spreadsheets'])
+_DEFAULT_SCOPES = ('https://www.googleapis.com/auth/spreadsheets',)
+
+# Credential refresh is not concurrent-safe in older google-auth versions
+_client_lock = threading.Lock()
+
+
+def create_default_client(scopes: tuple[str, ...] = _DEFAULT_SCOPES):
+    """
+        Cached per scopes - credential discovery (environment scan / metadata-server probe) and the
+        client's HTTP connection pool are reused across calls;
+        Call `_create_client` directly when distinct credentials are needed
+    """
+    with _client_lock:
+        return _create_client_cached(scopes)
+
+
+@functools.lru_cache(maxsize=4)
+def _create_client_cached(scopes: tuple[str, ...]):
+    return _create_client(scopes)
+
+
+def _create_client(scopes: tuple[str, ...]):
+    creds, _ = google.auth.default(scopes=list(scopes))
     return gspread.authorize(creds, http_client=gspread.BackOffHTTPClient)
 
 
@@ -64,15 +88,58 @@ def df_from_gsheet(ss_url_or_id: str | gspread.Worksheet, sheet_name: str = None
     else:
         ws = open_gsheet(ss_url_or_id, sheet_name)
 
-    values = ws.get_all_values()
+    values = np.array(ws.get_all_values(), dtype=object)
 
     if transpose:
-        values = [list(x) for x in zip(*values)]
+        # NumPy transpose is a zero-copy stride swap (no Python-level list rebuild)
+        values = values.T
 
     df = pd.DataFrame(values[1:], columns=values[0])
 
-    # For all string values, strip whitespace
-    df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
+    # Strip whitespace - `get_all_values()` returns only strings, so the vectorized
+    # per-column `.str.strip()` applies (no per-cell Python lambda)
+    df = df.apply(lambda col: col.str.strip())
+
+    return df
+
+
+def values_from_gsheet(ws: gspread.Worksheet) -> list[list[Any]]:
+    """
+        Fetch raw cell values with a minimal JSON payload:
+        - `fields='values'` strips all per-cell metadata from the response
+        - `UNFORMATTED_VALUE` returns numbers as native JSON numbers (no string-to-float re-parse)
+    """
+    res = ws.spreadsheet.values_get(
+        absolute_range_name(ws.title),
+        params={'valueRenderOption': 'UNFORMATTED_VALUE', 'fields': 'values'},
+    )
+    return res.get('values', [])
+
+
+def df_from_gsheet_csv(ss_url_or_id: str, sheet_name: str = None) -> pd.DataFrame:
+    """
+        Faster alternative to `df_from_gsheet` for large sheets:
+        Fetches the sheet through the CSV export endpoint and parses it with `pd.read_csv` (C parser),
+        instead of the cell-by-cell JSON of `get_all_values()`
+    """
+    ss_id, sheet_id = parse_spreadsheet_and_sheet_url(ss_url_or_id)
+
+    if sheet_name:
+        ws = open_gsheet(ss_url_or_id, sheet_name)
+        ss_id, sheet_id = ws.spreadsheet.id, ws.id
+
+    url = f'https://docs.google.com/spreadsheets/d/{ss_id}/export?format=csv'
+    if sheet_id is not None:
+        url += f'&gid={sheet_id}'
+
+    creds, _ = google.auth.default(scopes=['https://www.googleapis.com/auth/drive.readonly'])
+    res = AuthorizedSession(creds).get(url)
+    res.raise_for_status()
+
+    df = pd.read_csv(BytesIO(res.content), dtype=str, na_filter=False)
+
+    # Match `df_from_gsheet` behavior - strip whitespace (vectorized, per-column)
+    df = df.apply(lambda col: col.str.strip())
 
     return df
 
@@ -110,6 +177,18 @@ def append_to_gsheet(
     ws.append_rows(values_append, value_input_option='USER_ENTERED')
 
 
+def _split_consecutive(indices: list[int]) -> list[list[int]]:
+    """Split a sorted list of indices into runs of consecutive integers"""
+    runs = []
+    for i in indices:
+        if runs and i == runs[-1][-1] + 1:
+            runs[-1].append(i)
+        else:
+            runs.append([i])
+
+    return runs
+
+
 def update_gsheet_rows(
     ws: gspread.Worksheet, data_rows_indices: list[int] | None, records: list[Mapping | Any | None], *,
     match_columns: bool = True, columns_ws: list[str] = None, columns_include: list[str] = None,
@@ -117,15 +196,17 @@ def update_gsheet_rows(
     """
         Update a single row in the sheet with the record data
         :param data_row_index: 0-based index of the row to update (not including headers)
+        :param columns_ws: Pass the sheet headers if already known, to save a round-trip per call
     """
     # Remove None records
     if data_rows_indices is not None:
         data_rows_indices = [
-            row_index for i, row_index in enumerate(data_rows_indices) 
+            row_index for i, row_index in enumerate(data_rows_indices)
             if records[i] is not None
         ]
     else:
-        i_next_row = len(ws.get_all_values()) - 1
+        # Only column A is needed for the row count - don't download the entire sheet
+        i_next_row = len(ws.col_values(1)) - 1
         assert i_next_row >= 0, "Sheet must have at least one row (headers)"
         data_rows_indices = [i_next_row + i for i in range(len(records)) if records[i] is not None]
 
@@ -142,10 +223,11 @@ def update_gsheet_rows(
     if columns_include:
         df_rows = df_rows[columns_include]
 
+    # Single batched downcast instead of a Python-level loop with per-column assignment
     numeric_cols = df_rows.select_dtypes(include=np.number).columns
-    for col in numeric_cols:
-        df_rows[col] = pd.to_numeric(
-            df_rows[col], errors='coerce', downcast='float')
+    if len(numeric_cols) > 0:
+        df_rows[numeric_cols] = df_rows[numeric_cols].apply(
+            pd.to_numeric, errors='coerce', downcast='float')
 
     columns_include = columns_include or df_rows.columns
     columns_include = [normalize_column_name(c) for c in columns_include]
@@ -160,29 +242,27 @@ def update_gsheet_rows(
     # DataFrame must not contain NaNs, it will fail the batch update
     df_rows = df_rows.fillna('')
 
+    # Don't update entire rows, only the columns that are being updated;
+    # Coalesce adjacent columns into contiguous A1 ranges (one batch entry per run, not per cell)
+    columns_include_set = set(columns_include)
+    cols_update = [
+        i_col for i_col, col_current in enumerate(columns_ws)
+        if col_current in columns_include_set
+    ]
+    col_runs = _split_consecutive(cols_update)
+
     # Prepare the batch update
     list_updates = []
     for i_row, row_index in enumerate(data_rows_indices):
-        if records[i] is None:
-            continue
-
-        # list_updates += [
-        #     {
-        #         # One based index, skip headers (+2)
-        #         'range': f'A{row_index + 2}',
-        #         'values': [df_rows.iloc[i].values.tolist()]
-        #     }
-        # ]
-
-        # Don't update entire row, only the columns that are being updated
-        for i_col, col_current in enumerate(columns_ws):
-            if col_current in columns_include:
-                list_updates += [
-                    {
-                        'range': rowcol_to_a1(row_index + 2, i_col + 1),
-                        'values': [[df_rows.iloc[i_row][col_current]]]
-                    }
-                ]
+        row = df_rows.iloc[i_row]
+        for run in col_runs:
+            list_updates += [
+                {
+                    # One based index, skip headers (+2)
+                    'range': f'{rowcol_to_a1(row_index + 2, run[0] + 1)}:{rowcol_to_a1(row_index + 2, run[-1] + 1)}',
+                    'values': [[row[columns_ws[i_col]] for i_col in run]]
+                }
+            ]
 
     # Batch update
     logger.info(f'Updating rows: {[r + 2 for r in data_rows_indices]}')
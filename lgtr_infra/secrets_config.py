@@ -24,28 +24,47 @@ class SecretsConfigGcp:
     env_vars: dict[str, str] = field(default_factory=dict)
     secrets: dict[str, Any] = field(default_factory=dict)
 
+    # Bound concurrent requests and retry on quota errors, so bulk loads don't trip
+    # Secret Manager's per-project request ceiling
+    max_concurrent_requests = 16
+    max_attempts = 5
+
     @staticmethod
-    async def _get_secret_values(secret_ids: list[str], project_id: str) -> dict[str, str]:
+    async def _get_secret_values(secret_ids: list[str], project_id: str, client=None) -> dict[str, str]:
         # Import locally to avoid dependency on GCP libraries.
+        from google.api_core import exceptions as api_exceptions
         from google.cloud import secretmanager
 
-        async_client = secretmanager.SecretManagerServiceAsyncClient()
+        async_client = client or secretmanager.SecretManagerServiceAsyncClient()
+        semaphore = asyncio.Semaphore(SecretsConfigGcp.max_concurrent_requests)
         loaded_secrets = {}
 
         async def _load_secret(_secret_id):
-            _response = await async_client.access_secret_version(
-                name=f"projects/{project_id}/secrets/{_secret_id}/versions/latest"
-            )
-            loaded_secrets[_secret_id] = _response.payload.data.decode("UTF-8")
+            async with semaphore:
+                for attempt in range(SecretsConfigGcp.max_attempts):
+                    try:
+                        _response = await async_client.access_secret_version(
+                            name=f"projects/{project_id}/secrets/{_secret_id}/versions/latest"
+                        )
+                        break
+
+                    except api_exceptions.ResourceExhausted:
+                        if attempt == SecretsConfigGcp.max_attempts - 1:
+                            raise
+
+                        await asyncio.sleep(min(2 ** attempt, 30))
+
+                loaded_secrets[_secret_id] = _response.payload.data.decode("UTF-8")
 
         await asyncio.gather(*[_load_secret(_id) for _id in secret_ids])
         return loaded_secrets
 
     def load_secrets(self):
-        secret_ids_to_load = [
+        # Dedup - the same secret ID may be mapped both to an env var and to an obj key
+        secret_ids_to_load = list(dict.fromkeys([
             *(self.load_envs_from_secrets or {}).values(),
             *(self.load_objs_from_secrets or {}).values(),
-        ]
+        ]))
 
         loaded_secrets = asyncio.run(self._get_secret_values(secret_ids_to_load, self.project_id))
         self.env_vars = {
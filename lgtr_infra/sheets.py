@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import re
 from collections.abc import Iterator
 from typing import Any, Callable, Iterable, Optional, Tuple, Type, TypeVar
@@ -10,34 +11,21 @@ import pandas as pd
 T = TypeVar("T")
 
 
-def normalize_column_name(name: str, *, keep_brackets=False) -> str:
-    replace_chars = {
-        "\n": " ",
-        "\t": " ",
-        "-": "_",
-    }
-
-    if not keep_brackets:
-        # Remove contents of brackets [..] (..) - using Regex
-        name = re.sub(r"\[.*?\]", "", name)
-        name = re.sub(r"\(.*?\)", "", name)
-    else:
-        replace_chars.update({
-            "[": "",
-            "]": "",
-            "(": "",
-            ")": "",
-        })
+# Precompiled pieces for `normalize_column_name` - one regex pass and one translate pass per name
+_RE_BRACKETS = re.compile(r"\[.*?\]|\(.*?\)")
+_TRANS = str.maketrans({"\n": " ", "\t": " ", "-": "_"})
+_TRANS_KEEP_BRACKETS = str.maketrans({"\n": " ", "\t": " ", "-": "_", "[": "", "]": "", "(": "", ")": ""})
 
-    for k, v in replace_chars.items():
-        name = name.replace(k, v)
 
-    # Replace multiple spaces with single space, and spaces with underscores
-    name = " ".join(name.split())
-    name = name.replace(" ", "_")
-    name = name.lower()
+def normalize_column_name(name: str, *, keep_brackets=False) -> str:
+    if keep_brackets:
+        name = name.translate(_TRANS_KEEP_BRACKETS)
+    else:
+        # Remove contents of brackets [..] (..), then apply the char replacements
+        name = _RE_BRACKETS.sub("", name).translate(_TRANS)
 
-    return name
+    # Collapse whitespace runs into single underscores
+    return "_".join(name.split()).lower()
 
 
 def df_preprocess(df: pd.DataFrame, keep_brackets=False) -> pd.DataFrame:
@@ -54,40 +42,52 @@ def df_match_columns(df: pd.DataFrame, columns_ref: list[str], normalize=True) -
         columns_df = [normalize_column_name(c) for c in columns_df]
         columns_ref = [normalize_column_name(c) for c in columns_ref]
 
-    # Match the order of columns in df to the sheet
-    columns_df_order = [
-        columns_df.index(c) if c in columns_df else None
-        for c in columns_ref
-    ]
+    # Reorder the columns to match the sheet, fill missing columns with empty strings -
+    # `reindex` does the take in C instead of rebuilding every row in Python.
+    # Keep only the first occurrence when two source columns normalize to the same
+    # label (reindex rejects duplicate labels; the old positional lookup kept the first)
+    df = df.set_axis(columns_df, axis=1)
+    df = df.loc[:, ~df.columns.duplicated()]
+    df = df.reindex(columns=columns_ref, fill_value="")
 
-    # Create a new DataFrame with the columns in the order of the sheet,
-    # fill missing columns with empty strings
-    df = pd.DataFrame(
-        [
-            [row[i] if i is not None else "" for i in columns_df_order]
-            for row in df.values
-        ],
-        columns=[columns_df[i] if i is not None else "Unknown" for i in columns_df_order]
-    )
+    columns_known = set(columns_df)
+    df.columns = [c if c in columns_known else "Unknown" for c in columns_ref]
 
     return df
 
 
 def df_from_csv(path_csv: str) -> list[T]:
-    df = pd.read_csv(path_csv, na_filter=False)
+    try:
+        # The Arrow parser is multi-threaded and several times faster on large sheets
+        df = pd.read_csv(path_csv, na_filter=False, engine="pyarrow")
+    except ImportError:
+        df = pd.read_csv(path_csv, na_filter=False)
+
     return df
 
 
 def iterrows_typed(df: pd.DataFrame, cls: Type[T]) -> Iterator[Tuple[int, T]]:
-    for i_row, row in df.iterrows():
-        yield i_row, dacite.from_dict(cls, row.to_dict())
+    # Resolve the column position of each dataclass field once, then call the constructor
+    # directly per row - `itertuples` avoids the per-row Series boxing of `iterrows`,
+    # and skipping dacite avoids its per-row reflective type checks
+    field_columns = [
+        (field.name, df.columns.get_loc(field.name))
+        for field in dataclasses.fields(cls)
+        if field.name in df.columns
+    ]
+
+    for row in df.itertuples(index=True, name=None):
+        # row[0] is the index; column positions are shifted by 1
+        yield row[0], cls(**{name: row[i_col + 1] for name, i_col in field_columns})
 
 
+@functools.lru_cache(maxsize=None)
 def get_basic_type(t: Type) -> Type:
     """Get the basic type from a type with optional or Union"""
     return t.__args__[0] if hasattr(t, "__args__") else t
 
 
+@functools.lru_cache(maxsize=None)
 def get_dataclass_types(cls: Type[T]) -> dict[str, Type]:
     return {field.name: get_basic_type(field.type) for field in dataclasses.fields(cls)}
 
@@ -95,27 +95,31 @@ def get_dataclass_types(cls: Type[T]) -> dict[str, Type]:
 def records_from_df(record_type: Type[T], df: pd.DataFrame) -> list[T]:
     df = df_preprocess(df)
 
-    # Change types of columns in the DataFrame to match the dataclass
-    for field in dataclasses.fields(record_type):
-        if field.name in df.columns:
-            if get_basic_type(field.type) in (int, float):
-                df[field.name] = pd.to_numeric(df[field.name], errors="coerce").astype(float)
-                df[field.name] = df[field.name].map(lambda x: None if pd.isna(x) else x)
+    # Change types of columns in the DataFrame to match the dataclass - one vectorized
+    # pass over all numeric columns at once, with nulls mapped to None in C
+    field_types = get_dataclass_types(record_type)
+    numeric_cols = [
+        name for name, t in field_types.items()
+        if t in (int, float) and name in df.columns
+    ]
+
+    if numeric_cols:
+        df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
+        df[numeric_cols] = df[numeric_cols].astype(object).where(df[numeric_cols].notna(), None)
 
     return list([record for _, record in iterrows_typed(df, record_type)])
 
 
 def find_one(objects: Iterable[T], predicate: Callable[[T], Any], *, get_first=False) -> Optional[T]:
-    matches = [(i, obj) for i, obj in enumerate(objects) if predicate(obj)]
+    # Lazy scan with early exit - stops at the first match (or second, when
+    # checking uniqueness) instead of materializing every match up front
+    matches = ((i, obj) for i, obj in enumerate(objects) if predicate(obj))
 
-    try:
-        if get_first:
-            return next(iter(matches), None)
-        else:
-            if len(matches) > 1:
-                raise ValueError("Multiple records found")
+    first = next(matches, None)
+    if get_first:
+        return first
 
-            return matches[0]
+    if next(matches, None) is not None:
+        raise ValueError("Multiple records found")
 
-    except (StopIteration, IndexError):
-        return None
+    return first
@@ -1,34 +1,57 @@
 import datetime
 import functools
-import inspect
+import importlib
+import importlib.util
 import json
 import logging
+import os
 import pkgutil
 import subprocess
 import types
-import uuid
 import warnings
+from collections import deque
 from typing import TypeVar, Type, Iterable, Any, Callable
 
-import simple_parsing
+try:
+    # The C-backed encoder is several times faster on typical dict payloads
+    import orjson
+
+    def _orjson_dumps_sorted(obj):
+        # NON_STR_KEYS keeps the stdlib behavior of coercing int/float/bool dict keys
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _orjson_dumps_sorted = None
 
 T = TypeVar('T')
 
+# Built once - the stdlib fallbacks for the dedup serialization defaults
+_DEFAULT_DUMPS = functools.partial(json.dumps, sort_keys=True)
+_DEFAULT_LOADS = json.loads
+
 IMAGE_SUFFIXES = {
     '.jpg', '.jpeg', '.jfif', '.png', '.bmp', '.gif', '.tiff', '.tif', '.webp'
 }
 
+# Common-case variants precomputed so the usual lookup needs no .lower() allocation
+_IMAGE_SUFFIXES_FAST = frozenset(
+    variant for ext in IMAGE_SUFFIXES for variant in (ext, ext.upper(), ext.capitalize())
+)
+
 
 def shell(cmd, **kwargs):
     return subprocess.check_call(cmd, shell=True, **kwargs)
 
 
+@functools.lru_cache(maxsize=128)
 def is_image_extension(suffix: str):
-    ext = suffix.lower()
-    return ext in IMAGE_SUFFIXES
+    return suffix in _IMAGE_SUFFIXES_FAST or suffix.lower() in IMAGE_SUFFIXES
 
 
 def parse_dataclass_args(parse_type: Type[T], args: list[str] = None) -> T:
+    # Import locally - the argparse machinery is slow to import and most users of this
+    # module never parse CLI args
+    import simple_parsing
+
     warnings.warn(
         "parse_dataclass_args is deprecated, use `simple_parsing.parse()` directly instead", DeprecationWarning
     )
@@ -36,100 +59,187 @@ def parse_dataclass_args(parse_type: Type[T], args: list[str] = None) -> T:
 
 
 def dedup_with_serialization(
-    list_objects: Iterable[Any], *, dumps: Callable = None, loads: Callable = None
+    list_objects: Iterable[Any], *, dumps: Callable = None, loads: Callable = None,
+    roundtrip: bool = False
 ) -> list[Any]:
-    dumps = dumps or functools.partial(json.dumps, sort_keys=True)
-    loads = loads or json.loads
+    """
+        Deduplicate objects by their serialized form, preserving first-seen input order.
+        The serialization is only used as the identity key - the original objects are
+        returned, unless `roundtrip=True` restores the old deserialize-the-keys
+        behavior (normalized copies).
 
-    set_serialized = set(dumps(obj) for obj in list_objects)
-    return [
-        loads(serialized) for serialized in set_serialized
-    ]
+        Note: with the default (orjson-backed) key encoder, nan/inf serialize as null,
+        so objects differing only in those values dedup together
+
+    """
+    dumps = dumps or _orjson_dumps_sorted or _DEFAULT_DUMPS
+
+    seen = {}
+    for obj in list_objects:
+        seen.setdefault(dumps(obj), obj)
+
+    if roundtrip:
+        loads = loads or _DEFAULT_LOADS
+        return [loads(serialized) for serialized in seen]
+
+    return list(seen.values())
 
 
 def htimestamp(time=None, *, with_ms=True):
     if time is None:
-        time = datetime.datetime.utcnow()
+        time = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    # Direct integer formatting - strftime goes through locale-aware C code and
+    # the ms variant would need an extra [:-3] slice on top
+    base = (
+        f'{time.year:04d}{time.month:02d}{time.day:02d}'
+        f'_{time.hour:02d}{time.minute:02d}{time.second:02d}'
+    )
 
     if with_ms:
-        return time.strftime('%Y%m%d_%H%M%S_%f')[:-3]
+        return f'{base}_{time.microsecond // 1000:03d}'
     else:
-        return time.strftime('%Y%m%d_%H%M%S')
+        return base
 
 
 def htimestamp_parse(str_datetime: str):
+    # Both supported formats ('%Y%m%d_%H%M%S' + '.'/'_' + microseconds) are fixed-width
+    # integer fields, so slice-and-int directly - strptime interprets its format string
+    # on every call and is ~10x slower. Malformed input falls back to strptime for the
+    # original error message
+    s = str_datetime
     try:
-        dt = datetime.datetime.strptime(str_datetime, '%Y%m%d_%H%M%S.%f')
+        if len(s) < 17 or s[8] != '_' or s[15] not in '._':
+            raise ValueError
+
+        return datetime.datetime(
+            int(s[0:4]), int(s[4:6]), int(s[6:8]),
+            int(s[9:11]), int(s[11:13]), int(s[13:15]),
+            int(s[16:].ljust(6, '0')),
+        )
 
-    except ValueError:
-        dt = datetime.datetime.strptime(str_datetime, '%Y%m%d_%H%M%S_%f')
+    except (ValueError, IndexError):
+        # The separator before the microseconds picks the format ('.' legacy, '_' current)
+        if s[15:16] == '.':
+            return datetime.datetime.strptime(s, '%Y%m%d_%H%M%S.%f')
 
-    return dt
+        return datetime.datetime.strptime(s, '%Y%m%d_%H%M%S_%f')
 
 
 def short_uuid4():
-    return str(uuid.uuid4())[:8]
+    # 4 random bytes hex-encoded - same 8 hex chars as slicing a uuid4, without
+    # constructing and formatting the full UUID object
+    return os.urandom(4).hex()
 
 
 def htimestamp_uuid():
     return htimestamp() + '_' + short_uuid4()
 
 
+# Traversal results per package name - walk_packages re-stats and re-imports every
+# submodule on each call, which dominates discovery time on large packages
+_TRAVERSE_CACHE: dict[str, list[tuple[types.ModuleType, bool]]] = {}
+
+
+def invalidate_package_cache(name: str = None):
+    """Drop the cached traversal of one package by name, or all of them"""
+    if name is None:
+        _TRAVERSE_CACHE.clear()
+    else:
+        _TRAVERSE_CACHE.pop(name, None)
+
+
 def traverse_package(
     package: str | types.ModuleType,
     callback_module: Callable[[types.ModuleType], Any] = None,
     callback_package: Callable[[types.ModuleType], Any] = None
 ):
     """
-        Auto traverse a package and its sub-packages and modules, and call a callback
+        Auto traverse a package and its sub-packages and modules, and call a callback.
+        The traversal itself is cached per package - repeated calls replay the callbacks
+        over the already-imported modules
     """
     # Import the package
     if isinstance(package, str):
         package = __import__(package, fromlist=[""])
 
-    # Traverse the package and its sub-packages
-    packages_to_traverse = [package]
-    for package_current in packages_to_traverse:
+    cached = _TRAVERSE_CACHE.get(package.__name__)
+    if cached is not None:
+        for package_or_module, is_pkg in cached:
+            if is_pkg:
+                if callback_package is not None:
+                    callback_package(package_or_module)
+            elif callback_module is not None:
+                callback_module(package_or_module)
+
+        return
+
+    # Traverse the package and its sub-packages; the visited set makes the walk
+    # idempotent when a module is reachable under several names (namespace
+    # packages, re-exports)
+    discovered = []
+    visited = {package.__name__}
+    frontier = deque([package])
+    while frontier:
+        package_current = frontier.popleft()
         for _module_loader, name, is_pkg in pkgutil.walk_packages(package_current.__path__):
+            # Cheap existence probe first - a missing module costs a lookup instead of
+            # a raised-and-unwound ModuleNotFoundError
+            full_name = f"{package_current.__name__}.{name}"
+            spec = importlib.util.find_spec(full_name)
+            if spec is None or spec.loader is None:
+                logging.warning(
+                    f"Skipping module {name} in package {package_current.__name__} (No loadable spec)")
+                continue
+
             try:
-                package_or_module = __import__(
-                    f"{package_current.__name__}.{name}", fromlist=[""])
+                package_or_module = importlib.import_module(spec.name)
             except (ModuleNotFoundError, NameError):
-                logging.warning(f"Skipping module {name} in package {
-                                package_current.__name__} (Unable to import)")
+                # The module exists but importing it pulled in a missing dependency
+                logging.warning(
+                    f"Skipping module {name} in package {package_current.__name__} (Unable to import)")
                 continue
 
+            if package_or_module.__name__ in visited:
+                continue
+
+            visited.add(package_or_module.__name__)
+            discovered.append((package_or_module, is_pkg))
             if is_pkg:
-                packages_to_traverse.append(package_or_module)
+                frontier.append(package_or_module)
                 if callback_package is not None:
                     callback_package(package_or_module)
             else:
                 if callback_module is not None:
                     callback_module(package_or_module)
 
+    _TRAVERSE_CACHE[package.__name__] = discovered
 
-def discover_package_classes(package: str | types.ModuleType, criteria: Callable[[Type], bool] = None):
-    discovered_classes = []
+
+def _discover_package_members(package: str | types.ModuleType, member_check: Callable[[Any], bool]):
+    # One pass over each module dict - unlike inspect.getmembers, this neither
+    # sorts the names nor builds an intermediate (name, obj) list per module
+    discovered = []
 
     def _callback_module(module: types.ModuleType):
-        for _cls_name, cls in inspect.getmembers(module, inspect.isclass):
-            if criteria is None or criteria(cls):
-                discovered_classes.append(cls)
+        for obj in vars(module).values():
+            if member_check(obj):
+                discovered.append(obj)
 
     traverse_package(package, callback_module=_callback_module)
-    return discovered_classes
+    return discovered
 
 
-def discover_package_methods(package: str | types.ModuleType, criteria: Callable[[Any], bool] = None):
-    discovered_methods = []
+def discover_package_classes(package: str | types.ModuleType, criteria: Callable[[Type], bool] = None):
+    return _discover_package_members(
+        package, lambda obj: isinstance(obj, type) and (criteria is None or criteria(obj))
+    )
 
-    def _callback_module(module: types.ModuleType):
-        for _func_name, func in inspect.getmembers(module, inspect.isfunction):
-            if criteria is None or criteria(func):
-                discovered_methods.append(func)
 
-    traverse_package(package, callback_module=_callback_module)
-    return discovered_methods
+def discover_package_methods(package: str | types.ModuleType, criteria: Callable[[Any], bool] = None):
+    return _discover_package_members(
+        package, lambda obj: isinstance(obj, types.FunctionType) and (criteria is None or criteria(obj))
+    )
 
 
 def transform_recursive(obj: Any, func: Callable) -> Any:
@@ -138,14 +248,44 @@ def transform_recursive(obj: Any, func: Callable) -> Any:
 
         :param: obj: The object to transform. Supports primitives such as dict, list, etc.
         :param: func: The transformation function to apply to each primitive element.
+
+        Implemented as an iterative post-order traversal with an explicit stack, so deep
+        trees pay no per-node Python frame cost and cannot hit the recursion limit
     """
-    if isinstance(obj, dict):
-        obj = {k: transform_recursive(v, func) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        obj = [transform_recursive(item, func) for item in obj]
-    elif isinstance(obj, tuple):
-        obj = tuple(transform_recursive(item, func) for item in obj)
-    elif isinstance(obj, set):
-        obj = {transform_recursive(item, func) for item in obj}
-
-    return func(obj)
+    # Phase flag: False = expand children, True = all children transformed, rebuild
+    stack = [(obj, False)]
+    results = []
+
+    while stack:
+        node, expanded = stack.pop()
+
+        if not expanded:
+            if isinstance(node, (dict, list, tuple, set)):
+                stack.append((node, True))
+                children = node.values() if isinstance(node, dict) else node
+                for child in children:
+                    stack.append((child, False))
+            else:
+                results.append(func(node))
+
+            continue
+
+        # Children were pushed in order, so they were popped - and their results
+        # appended - in reverse; take the top len(node) results and flip them back
+        n_children = len(node)
+        children = results[len(results) - n_children:]
+        del results[len(results) - n_children:]
+        children.reverse()
+
+        if isinstance(node, dict):
+            rebuilt = dict(zip(node.keys(), children))
+        elif isinstance(node, list):
+            rebuilt = children
+        elif isinstance(node, tuple):
+            rebuilt = tuple(children)
+        else:
+            rebuilt = set(children)
+
+        results.append(func(rebuilt))
+
+    return results[0]
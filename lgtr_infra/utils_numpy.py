@@ -1,28 +1,101 @@
-import base64
 from typing import Union
 
 import numpy as np
 
+try:
+    # Optional - parallel JIT packing kernel for very large bool arrays; cache=True
+    # makes the compilation cost one-time per machine
+    import numba
+
+    @numba.njit(cache=True, parallel=True)
+    def _packbits_parallel(src, dst):  # pragma: no cover - requires numba
+        for i in numba.prange(dst.size):
+            b = 0
+            base = i * 8
+            for j in range(8):
+                b |= (src[base + j] & 1) << (7 - j)
+
+            dst[i] = b
+
+except ImportError:
+    _packbits_parallel = None
+
+# Below this, ufunc dispatch overhead is negligible and the JIT path isn't worth it
+_NUMBA_PACK_MIN_SIZE = 1 << 20
+
+
+def _packbits(array: np.ndarray) -> np.ndarray:
+    if (
+        _packbits_parallel is not None
+        and array.size >= _NUMBA_PACK_MIN_SIZE
+        and array.size % 8 == 0
+    ):
+        # Flatten - the kernel indexes src linearly, and packbits output is flat anyway
+        src = np.ascontiguousarray(array).view(np.uint8).reshape(-1)
+        dst = np.empty(array.size // 8, dtype=np.uint8)
+        _packbits_parallel(src, dst)
+        return dst
+
+    return np.packbits(array, bitorder='big')
+
+
+def array_to_base64url(array: Union[np.ndarray | bytes], *, pack: bool = True) -> str:
+    """
+        :param pack: For bool arrays, bit-pack before encoding (8x smaller payload).
+            `pack=False` encodes the raw one-byte-per-bool buffer instead - larger on
+            the wire, but skips the packing pass when bandwidth is not the bottleneck;
+            decode such payloads with dtype=np.uint8 and view as bool
+    """
+    import base64
 
-def array_to_base64url(array: Union[np.ndarray | bytes]) -> str:
     if isinstance(array, bytes):
         embeddings_bytes = array
 
     else:
-        if array.dtype == bool:
-            array = np.packbits(array)
+        if array.dtype == bool and pack:
+            array = _packbits(array)
 
-        embeddings_bytes = array.tobytes()
+        # Zero-copy view of the buffer - b64encode takes any bytes-like object,
+        # so skip the full tobytes() copy
+        embeddings_bytes = memoryview(np.ascontiguousarray(array)).cast('B')
 
     embeddings_base64 = base64.urlsafe_b64encode(embeddings_bytes).decode('utf-8')
     return embeddings_base64
 
 
+def array_to_base64url_iter(array: Union[np.ndarray | bytes], *, chunk_bytes: int = 1 << 20):
+    """
+        Stream-encoding variant of `array_to_base64url` - yields url-safe base64 string
+        chunks whose concatenation equals the non-streaming output, keeping peak memory
+        at O(chunk_bytes) instead of the full 1.33x base64 expansion.
+
+        :param chunk_bytes: Encoded chunk size; rounded down to a multiple of 3 so no
+            padding appears mid-stream
+    """
+    import base64
+
+    if isinstance(array, bytes):
+        buffer = memoryview(array)
+
+    else:
+        if array.dtype == bool:
+            array = _packbits(array)
+
+        buffer = memoryview(np.ascontiguousarray(array)).cast('B')
+
+    chunk_bytes = max(chunk_bytes - chunk_bytes % 3, 3)
+    for start in range(0, len(buffer), chunk_bytes):
+        yield base64.urlsafe_b64encode(buffer[start:start + chunk_bytes]).decode('utf-8')
+
+
 def array_from_base64url(filename: str, dtype: type, *, length: int = None) -> np.ndarray:
+    import base64
+
     embeddings_base64 = filename
     embeddings_bytes = base64.urlsafe_b64decode(embeddings_base64)
     if dtype == np.dtype(bool):
-        embeddings = np.unpackbits(np.frombuffer(embeddings_bytes, dtype=np.uint8)).astype(bool)
+        # unpackbits already yields 0/1 uint8 - reinterpret in place instead of copying
+        embeddings = np.unpackbits(np.frombuffer(embeddings_bytes, dtype=np.uint8)).view(np.bool_)
     else:
         embeddings = np.frombuffer(embeddings_bytes, dtype)
 